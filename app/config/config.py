@@ -1,10 +1,19 @@
+import asyncio
 import os
-from sqlalchemy import create_engine
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from uuid import uuid4
+from fastapi import FastAPI, Request
+from sqlalchemy import URL, create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from dotenv import load_dotenv
 
-load_dotenv()
+# โหลด .env ครั้งเดียวต่อ process (create_tables.py อาจโหลดไว้แล้ว)
+if not os.environ.get("_DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
 
 DB_HOST = os.getenv("DB_HOST", "localhost")
 DB_PORT = os.getenv("DB_PORT", "5432")
@@ -12,18 +21,111 @@ DB_USERNAME = os.getenv("DB_USERNAME", "postgres")
 DB_PASSWORD = os.getenv("DB_PASSWORD", "janeiei54505")
 DB_NAME = os.getenv("DB_NAME", "meeting_room")
 
-SQLALCHEMY_DATABASE_URL = f"postgresql://{DB_USERNAME}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+# pool ต่อ worker: workers x (DB_POOL_SIZE + DB_MAX_OVERFLOW) ต้องไม่เกิน max_connections ของ Postgres
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# จำนวน connection ที่เปิดรอไว้ตอน startup (ไม่เกิน DB_POOL_SIZE)
+DB_POOL_WARMUP = int(os.getenv("DB_POOL_WARMUP", "5"))
+# วินาทีที่รอต่อ connection ตอน warm-up (asyncpg รอ connect ได้ถึง 60 วินาที)
+DB_POOL_WARMUP_TIMEOUT = float(os.getenv("DB_POOL_WARMUP_TIMEOUT", "3"))
 
-print(f"🔧 Database URL: postgresql://{DB_USERNAME}:***@{DB_HOST}:{DB_PORT}/{DB_NAME}")
+# ต่อผ่าน PgBouncer (transaction pooling) ให้ PgBouncer เป็นคนจัดการ pool แทน
+DB_USE_PGBOUNCER = os.getenv("DB_USE_PGBOUNCER") == "true"
+
+# สร้าง URL ด้วย URL.create ให้ password ที่มี @ / : ใช้ได้โดยไม่ต้อง encode เอง
+def _database_url(drivername: str) -> URL:
+    return URL.create(
+        drivername,
+        username=DB_USERNAME,
+        password=DB_PASSWORD,
+        host=DB_HOST,
+        port=int(DB_PORT),
+        database=DB_NAME,
+    )
+
+
+SQLALCHEMY_DATABASE_URL = _database_url("postgresql+asyncpg")
+# URL แบบ sync (psycopg2) สำหรับ script อย่าง create_tables.py
+SYNC_DATABASE_URL = _database_url("postgresql")
+
+if DB_USE_PGBOUNCER:
+    # transaction pooling ใช้ prepared statement ข้าม transaction ไม่ได้
+    pool_options = {
+        "poolclass": NullPool,
+        "connect_args": {
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        },
+    }
+else:
+    pool_options = {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_pre_ping": True,
+        "pool_recycle": DB_POOL_RECYCLE,
+    }
+
+def create_db_engine():
+    return create_async_engine(
+        SQLALCHEMY_DATABASE_URL,
+        # log SQL เฉพาะตอนตั้ง SQLALCHEMY_ECHO=true (slow query ใน production ใช้ log_min_duration_statement ของ Postgres)
+        echo="debug" if os.getenv("SQLALCHEMY_ECHO") == "true" else False,
+        **pool_options
+    )
+
+
+# engine แบบ sync สำหรับ script สร้างครั้งเดียวต่อ process แล้วใช้ซ้ำ
+@lru_cache(maxsize=1)
+def get_engine():
+    return create_engine(
+        SYNC_DATABASE_URL,
+        echo=False,
+        executemany_mode="values_plus_batch",
+        insertmanyvalues_page_size=1000,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_pre_ping=True,
+        pool_recycle=DB_POOL_RECYCLE
+    )
+
+
+async def warm_up_pool(engine) -> None:
+    # เปิด connection รอไว้บางส่วนตั้งแต่ startup ไม่ให้ request แรกต้องรอ
+    # ต่อไม่ได้ก็แค่ log แล้วเปิด app ต่อ (pool จะต่อใหม่เองตอนมี request)
+    if DB_USE_PGBOUNCER:
+        return
+    # จำกัดเวลาแต่ละ connection ไม่ให้ DB ที่ติดต่อไม่ได้ดึง startup ไว้นาน (ต่อพร้อมกัน รวมแล้วไม่เกิน timeout)
+    results = await asyncio.gather(
+        *(
+            asyncio.wait_for(engine.connect(), DB_POOL_WARMUP_TIMEOUT)
+            for _ in range(min(DB_POOL_SIZE, DB_POOL_WARMUP))
+        ),
+        return_exceptions=True
+    )
+    failures = [result for result in results if isinstance(result, BaseException)]
+    if failures:
+        print(f"⚠️ Pool warm-up: {len(failures)}/{len(results)} connections failed: {failures[0]!r}")
+    for result in results:
+        if not isinstance(result, BaseException):
+            await result.close()
+
+
+@asynccontextmanager
+async def db_lifespan(app: FastAPI):
+    engine = create_db_engine()
+    await warm_up_pool(engine)
+    # ไม่ expire หลัง commit จะได้ไม่ต้อง SELECT ซ้ำ (default ของ column เป็นฝั่ง Python ทั้งหมด)
+    app.state.session_factory = async_sessionmaker(autoflush=False, expire_on_commit=False, bind=engine)
+    yield
+    await engine.dispose()
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, echo=True if os.getenv("DEBUG") == "true" else False)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
\ No newline at end of file
+async def get_db(request: Request):
+    async with request.app.state.session_factory() as db:
+        yield db
\ No newline at end of file
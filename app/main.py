@@ -1,62 +1,75 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.middleware.gzip import GZipMiddleware
 import uvicorn
 import os
+import sys
+
+# รันตรง ๆ ด้วย python main.py: เพิ่ม root ของโปรเจกต์ให้ import package app ได้
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 try:
-    from router import router
-    ROUTER_LOADED = True
+    from app.router import router
+    from app.config.config import db_lifespan
     print("✅ Router loaded successfully!")
-except Exception as e:
+except ImportError as e:
+    # ให้ deploy พังไปเลย ดีกว่าเปิด API ที่ไม่มี route จริง
     print(f"❌ Could not load router: {e}")
-    ROUTER_LOADED = False
+    raise
 
 app = FastAPI(
     title="Meeting Room Booking API",
     description="Simple Meeting Room Booking System with Docker + ngrok",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=db_lifespan
 )
 
-# CORS middleware
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# CORS middleware (CORS_ORIGINS คั่นด้วย comma, ค่าเริ่มต้นคือ frontend ตอน dev)
+CORS_ORIGINS = [origin.strip() for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",") if origin.strip()]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=CORS_ORIGINS,
+    allow_credentials=False,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
+    allow_headers=["Content-Type", "If-None-Match"],
+    max_age=86400,
 )
 
-if ROUTER_LOADED:
-    app.include_router(router, prefix="/api/v1")
-    print("✅ API routes registered successfully!")
+app.include_router(router, prefix="/api/v1")
+print("✅ API routes registered successfully!")
+
+# response คงที่ สร้างครั้งเดียวตอน import
+_ROOT_RESPONSE = {
+    "message": "🏢 Welcome to Meeting Room Booking System",
+    "version": "1.0.0",
+    "status": "running",
+    "router_loaded": True,
+    "api_base": "/api/v1"
+}
+
+_HEALTH_RESPONSE = {
+    "status": "healthy",
+    "router_loaded": True
+}
 
 @app.get("/", tags=["Root"])
-def read_root():
-    return {
-        "message": "🏢 Welcome to Meeting Room Booking System",
-        "version": "1.0.0",
-        "status": "running",
-        "router_loaded": ROUTER_LOADED,
-        "api_base": "/api/v1" if ROUTER_LOADED else "Router not loaded"
-    }
+async def read_root(response: Response):
+    response.headers["Cache-Control"] = "public, max-age=60"
+    return _ROOT_RESPONSE
 
 @app.get("/health", tags=["Health"])
-def health_check():
-    return {
-        "status": "healthy",
-        "router_loaded": ROUTER_LOADED
-    }
-
-if not ROUTER_LOADED:
-    @app.get("/api/v1/status", tags=["Fallback"])
-    def fallback_status():
-        return {
-            "message": "⚠️ Main router not loaded, using fallback endpoints",
-            "issue": "Check router.py dependencies"
-        }
+async def health_check(response: Response):
+    response.headers["Cache-Control"] = "public, max-age=60"
+    return _HEALTH_RESPONSE
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
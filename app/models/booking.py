@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Time
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Time, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime, time
@@ -23,6 +23,18 @@ class Room(Base):
 
 class Booking(Base):
     __tablename__ = 'booking'
+    __table_args__ = (
+        Index('ix_booking_room_time', 'room_id', 'is_cancelled', 'start_datetime', 'end_datetime'),
+        Index('ix_booking_email_time', 'organizer_email', 'is_cancelled', 'start_datetime'),
+        Index('ix_booking_start', 'start_datetime'),
+        # trigram index สำหรับ ILIKE '%...%' ใน search_bookings (ต้องมี extension pg_trgm)
+        Index('ix_booking_title_trgm', 'title',
+              postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+        Index('ix_booking_organizer_name_trgm', 'organizer_name',
+              postgresql_using='gin', postgresql_ops={'organizer_name': 'gin_trgm_ops'}),
+        Index('ix_booking_description_trgm', 'description',
+              postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'}),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     room_id = Column(Integer, ForeignKey('room.id'), nullable=False)
@@ -1,9 +1,14 @@
-from pydantic import BaseModel, validator
+from pydantic import AliasPath, BaseModel, Field, validator
 from typing import Optional, List
-from datetime import datetime, date
-from sqlalchemy.orm import Session
-from models.booking import Booking, Room
-from modules.room.room import check_room_availability
+from datetime import datetime, date, time
+from sqlalchemy import and_, bindparam, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from app.models.booking import Booking, Room
+from app.modules.room.room import BOOKING_SUMMARY_OPTIONS, check_room_availability, get_room_cached
+
+_DAY_START = time.min
+_DAY_END = time.max
 
 
 class BookingCreate(BaseModel):
@@ -50,7 +55,7 @@ class BookingUpdate(BaseModel):  # แก้ไขการจอง
 class BookingResponse(BaseModel):
     id: int
     room_id: int
-    room_name: str
+    room_name: str = Field("", validation_alias=AliasPath("room_rel", "name"))
     title: str
     organizer_name: str
     organizer_email: Optional[str]
@@ -67,30 +72,42 @@ class BookingResponse(BaseModel):
     class Config:
         from_attributes = True
 
-    @classmethod
-    def from_booking(cls, booking):
-        return cls(
-            id=booking.id,
-            room_id=booking.room_id,
-            room_name=booking.room_rel.name if booking.room_rel else "",
-            title=booking.title,
-            organizer_name=booking.organizer_name,
-            organizer_email=booking.organizer_email,
-            participant_count=booking.participant_count,
-            start_datetime=booking.start_datetime,
-            end_datetime=booking.end_datetime,
-            description=booking.description,
-            notes=booking.notes,
-            is_cancelled=booking.is_cancelled,
-            cancelled_at=booking.cancelled_at,
-            cancellation_reason=booking.cancellation_reason,  # updated
-            created_at=booking.created_at,
+
+class BookingSummaryResponse(BaseModel):  # สำหรับหน้า list ไม่มี description/notes
+    id: int
+    room_id: int
+    room_name: str = Field("", validation_alias=AliasPath("room_rel", "name"))
+    title: str
+    organizer_name: str
+    organizer_email: Optional[str]
+    participant_count: int
+    start_datetime: datetime
+    end_datetime: datetime
+    is_cancelled: bool
+    cancelled_at: Optional[datetime]
+    cancellation_reason: Optional[str]
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+# statement ค้นหาสร้างครั้งเดียว เปลี่ยนแค่ค่า pattern ตอนเรียก
+_SEARCH_STMT = select(Booking).options(selectinload(Booking.room_rel)).where(
+    and_(
+        Booking.is_cancelled == False,
+        or_(
+            Booking.title.ilike(bindparam("pattern")),
+            Booking.organizer_name.ilike(bindparam("pattern")),
+            Booking.description.ilike(bindparam("pattern"))
         )
+    )
+)
 
 
-def create_booking(db: Session, booking: BookingCreate) -> Booking:  # สร้างการจอง
+async def create_booking(db: AsyncSession, booking: BookingCreate) -> Booking:  # สร้างการจอง
     # ตรวจสอบห้อง
-    room = db.query(Room).filter(Room.id == booking.room_id).first()
+    room = await get_room_cached(db, booking.room_id)
     if not room:
         raise ValueError("ไม่พบห้องประชุม")
 
@@ -102,7 +119,7 @@ def create_booking(db: Session, booking: BookingCreate) -> Booking:  # สร้
         raise ValueError(f"จำนวนผู้เข้าร่วม ({booking.participant_count}) เกินความจุห้อง ({room.capacity})")
 
     # ตรวจว่าห้องว่าไหม
-    availability = check_room_availability(
+    availability = await check_room_availability(
         db, booking.room_id, booking.start_datetime, booking.end_datetime
     )
 
@@ -112,13 +129,14 @@ def create_booking(db: Session, booking: BookingCreate) -> Booking:  # สร้
     # สร้างการจอง
     db_booking = Booking(**booking.dict())
     db.add(db_booking)
-    db.commit()
-    db.refresh(db_booking)
+    await db.commit()
+    # async โหลด relationship แบบ lazy ไม่ได้ ต้องโหลด room_rel ไว้ให้ response
+    await db.refresh(db_booking, attribute_names=["room_rel"])
     return db_booking
 
 
-def get_bookings(  # ดึงรายการการจอง
-        db: Session,
+async def get_bookings(  # ดึงรายการการจอง
+        db: AsyncSession,
         skip: int = 0,
         limit: int = 100,
         room_id: Optional[int] = None,
@@ -127,36 +145,38 @@ def get_bookings(  # ดึงรายการการจอง
         end_date: Optional[date] = None,
         include_cancelled: bool = False
 ) -> List[Booking]:
-    query = db.query(Booking)
+    stmt = select(Booking).options(selectinload(Booking.room_rel))
 
     if not include_cancelled:
-        query = query.filter(Booking.is_cancelled == False)
+        stmt = stmt.where(Booking.is_cancelled == False)
 
     if room_id:
-        query = query.filter(Booking.room_id == room_id)
+        stmt = stmt.where(Booking.room_id == room_id)
 
     if organizer_email:
-        query = query.filter(Booking.organizer_email == organizer_email)
+        stmt = stmt.where(Booking.organizer_email == organizer_email)
 
     if start_date:
-        query = query.filter(Booking.start_datetime >= datetime.combine(start_date, datetime.min.time()))
+        stmt = stmt.where(Booking.start_datetime >= datetime.combine(start_date, _DAY_START))
 
     if end_date:
-        query = query.filter(Booking.start_datetime <= datetime.combine(end_date, datetime.max.time()))
+        stmt = stmt.where(Booking.start_datetime <= datetime.combine(end_date, _DAY_END))
 
-    return query.order_by(Booking.start_datetime.desc()).offset(skip).limit(limit).all()
+    stmt = stmt.order_by(Booking.start_datetime.desc()).offset(skip).limit(limit)
+    return (await db.execute(stmt)).scalars().all()
 
 
-def get_booking(db: Session, booking_id: int) -> Optional[Booking]:  # get by id
-    return db.query(Booking).filter(Booking.id == booking_id).first()
+async def get_booking(db: AsyncSession, booking_id: int) -> Optional[Booking]:  # get by id
+    stmt = select(Booking).options(selectinload(Booking.room_rel)).where(Booking.id == booking_id)
+    return (await db.execute(stmt)).scalars().first()
 
 
-def update_booking(  # แก้ไขการจอง
-        db: Session,
+async def update_booking(  # แก้ไขการจอง
+        db: AsyncSession,
         booking_id: int,
         booking_update: BookingUpdate
 ) -> Optional[Booking]:
-    booking = db.query(Booking).filter(Booking.id == booking_id).first()
+    booking = await get_booking(db, booking_id)
     if not booking:
         return None
 
@@ -170,7 +190,7 @@ def update_booking(  # แก้ไขการจอง
         new_start = update_data.get('start_datetime', booking.start_datetime)
         new_end = update_data.get('end_datetime', booking.end_datetime)
 
-        availability = check_room_availability(
+        availability = await check_room_availability(
             db, booking.room_id, new_start, new_end, booking.id
         )
 
@@ -179,24 +199,23 @@ def update_booking(  # แก้ไขการจอง
 
     # ตรวจสอบ capacity
     if 'participant_count' in update_data:
-        room = db.query(Room).filter(Room.id == booking.room_id).first()
+        room = await get_room_cached(db, booking.room_id)
         if update_data['participant_count'] > room.capacity:
             raise ValueError(f"จำนวนผู้เข้าร่วม ({update_data['participant_count']}) เกินความจุห้อง ({room.capacity})")
 
     for field, value in update_data.items():
         setattr(booking, field, value)
 
-    db.commit()
-    db.refresh(booking)
+    await db.commit()
     return booking
 
 
-def cancel_booking(  # ยกเลิกการจอง
-        db: Session,
+async def cancel_booking(  # ยกเลิกการจอง
+        db: AsyncSession,
         booking_id: int,
         reason: Optional[str] = None
 ) -> Optional[Booking]:
-    booking = db.query(Booking).filter(Booking.id == booking_id).first()
+    booking = (await db.execute(select(Booking).where(Booking.id == booking_id))).scalars().first()
     if not booking:
         return None
 
@@ -207,47 +226,44 @@ def cancel_booking(  # ยกเลิกการจอง
     booking.cancelled_at = datetime.utcnow()
     booking.cancellation_reason = reason  # updated
 
-    db.commit()
-    db.refresh(booking)
+    await db.commit()
     return booking
 
 
-def get_upcoming_bookings(db: Session, days: int = 7) -> List[Booking]:  # การจองล่วงหน้า/ที่กำลังจะถึง
+async def get_upcoming_bookings(db: AsyncSession, days: int = 7) -> List[Booking]:  # การจองล่วงหน้า/ที่กำลังจะถึง
     from datetime import timedelta
 
     start_time = datetime.utcnow()
     end_time = start_time + timedelta(days=days)
 
-    return db.query(Booking).filter(
+    stmt = select(Booking).options(*BOOKING_SUMMARY_OPTIONS).where(
         Booking.start_datetime >= start_time,
         Booking.start_datetime <= end_time,
         Booking.is_cancelled == False
-    ).order_by(Booking.start_datetime).all()
+    ).order_by(Booking.start_datetime)
+    return (await db.execute(stmt)).scalars().all()
 
 
-def get_today_bookings(db: Session) -> List[Booking]:  # การจองวันนี้
+async def get_today_bookings(db: AsyncSession) -> List[Booking]:  # การจองวันนี้
     today = date.today()
-    start_of_day = datetime.combine(today, datetime.min.time())
-    end_of_day = datetime.combine(today, datetime.max.time())
+    start_of_day = datetime.combine(today, _DAY_START)
+    end_of_day = datetime.combine(today, _DAY_END)
 
-    return db.query(Booking).filter(
+    stmt = select(Booking).options(*BOOKING_SUMMARY_OPTIONS).where(
         Booking.start_datetime >= start_of_day,
         Booking.start_datetime <= end_of_day,
         Booking.is_cancelled == False
-    ).order_by(Booking.start_datetime).all()
+    ).order_by(Booking.start_datetime)
+    return (await db.execute(stmt)).scalars().all()
 
 
-def get_my_bookings(db: Session, organizer_email: str) -> List[Booking]:  # my การจอง
-    return db.query(Booking).filter(
+async def get_my_bookings(db: AsyncSession, organizer_email: str) -> List[Booking]:  # my การจอง
+    stmt = select(Booking).options(selectinload(Booking.room_rel)).where(
         Booking.organizer_email == organizer_email,
         Booking.is_cancelled == False
-    ).order_by(Booking.start_datetime.desc()).all()
+    ).order_by(Booking.start_datetime.desc())
+    return (await db.execute(stmt)).scalars().all()
 
 
-def search_bookings(db: Session, search_term: str) -> List[Booking]:  # ค้นหาการจอง
-    search_pattern = f"%{search_term}%"
-    return db.query(Booking).filter(
-        (Booking.title.ilike(search_pattern)) |
-        (Booking.organizer_name.ilike(search_pattern)) |
-        (Booking.description.ilike(search_pattern))
-    ).filter(Booking.is_cancelled == False).all()
+async def search_bookings(db: AsyncSession, search_term: str) -> List[Booking]:  # ค้นหาการจอง
+    return (await db.execute(_SEARCH_STMT, {"pattern": f"%{search_term}%"})).scalars().all()
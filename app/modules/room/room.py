@@ -1,12 +1,27 @@
-from distutils.command.install import value
-
 from pydantic import BaseModel, validator
 from typing import Optional, List
 from datetime import datetime, time
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from cachetools import TTLCache
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, exists, func, select
+from sqlalchemy.orm import load_only, selectinload
+
+from app.models.booking import Room, Booking
+
+_DAY_START = time.min
+_DAY_END = time.max
 
-from models.booking import Room, Booking
+# โหลดเฉพาะ column ที่ BookingSummaryResponse ใช้ (ไม่ดึง description/notes ที่เป็น TEXT ยาว)
+# ใช้ทั้ง schedule ที่นี่และ upcoming/today ใน booking.py
+BOOKING_SUMMARY_OPTIONS = (
+    load_only(
+        Booking.id, Booking.room_id, Booking.title, Booking.organizer_name,
+        Booking.organizer_email, Booking.participant_count,
+        Booking.start_datetime, Booking.end_datetime, Booking.is_cancelled,
+        Booking.cancelled_at, Booking.cancellation_reason, Booking.created_at
+    ),
+    selectinload(Booking.room_rel).load_only(Room.name),
+)
 
 
 class RoomCreate(BaseModel):
@@ -22,8 +37,8 @@ class RoomCreate(BaseModel):
             raise ValueError('capacity must be positive')
         return v
 
-    def endtime_after_start_time(cls, v):
-        if 'start_time' in value and v <= value['start_time']:
+    def endtime_after_start_time(cls, v, values):
+        if 'start_time' in values and v <= values['start_time']:
             raise ValueError('start time must be after start time')
         return v
 
@@ -62,43 +77,69 @@ class RoomAvailability(BaseModel):  # check ว่าห้องว่างไ
     reason: Optional[str] = None
 
 
+# cache ข้อมูลห้องต่อ process ใช้เฉพาะตอนตรวจสอบการจอง (GET ห้องยังอ่านจาก DB)
+# เข้าถึงจาก event loop thread เดียว ไม่ต้องมี lock
+_room_cache = TTLCache(maxsize=1024, ttl=60)
+
+
+async def get_room_cached(db: AsyncSession, room_id: int) -> Optional[RoomResponse]:
+    cached = _room_cache.get(room_id)
+    if cached is not None:
+        return cached
+
+    room = await get_room(db, room_id)
+    if not room:
+        return None
+
+    snapshot = RoomResponse.model_validate(room)
+    _room_cache[room_id] = snapshot
+    return snapshot
+
+
+def invalidate_room_cache(room_id: int) -> None:
+    _room_cache.pop(room_id, None)
+
+
+async def _get_room_by_name(db: AsyncSession, name: str) -> Optional[Room]:
+    return (await db.execute(select(Room).where(Room.name == name))).scalars().first()
+
+
 # funtion
-def create_room(db: Session, room: RoomCreate) -> Room:
-    existing = db.query(Room).filter(Room.name == room.name).first()
+async def create_room(db: AsyncSession, room: RoomCreate) -> Room:
+    existing = await _get_room_by_name(db, room.name)
     if existing:
         raise ValueError(f"ห้อง '{room.name}' มีอยู่แล้ว")
 
     db_room = Room(**room.dict())
     db.add(db_room)
-    db.commit()
-    db.refresh(db_room)
+    await db.commit()
     return db_room
 
 
-def get_rooms(
-        db: Session,
+async def get_rooms(
+        db: AsyncSession,
         skip: int = 0,
         limit: int = 100,
         active_only: bool = True
 ) -> List[Room]:
-    query = db.query(Room)  # ดึงรายการห้อง
+    stmt = select(Room)  # ดึงรายการห้อง
 
     if active_only:
-        query = query.filter(Room.is_active == True)
+        stmt = stmt.where(Room.is_active == True)
 
-    return query.offset(skip).limit(limit).all()
+    return (await db.execute(stmt.offset(skip).limit(limit))).scalars().all()
 
 
-def get_room(db: Session, room_id: int) -> Optional[Room]:  # ดึงตาม id
-    return db.query(Room).filter(Room.id == room_id).first()
+async def get_room(db: AsyncSession, room_id: int) -> Optional[Room]:  # ดึงตาม id
+    return await db.get(Room, room_id)
 
 
-def update_room(db: Session, room_id: int, room_update: RoomUpdate) -> Optional[Room]:  # แก้ไขข้อมูลห้อง
-    db_room = db.query(Room).filter(Room.id == room_id).first()
+async def update_room(db: AsyncSession, room_id: int, room_update: RoomUpdate) -> Optional[Room]:  # แก้ไขข้อมูลห้อง
+    db_room = await get_room(db, room_id)
     if not db_room:
         return None
     if room_update.name and room_update.name != db_room.name:
-        existing = db.query(Room).filter(Room.name == room_update.name).first()
+        existing = await _get_room_by_name(db, room_update.name)
         if existing:
             raise ValueError(f"ห้อง '{room_update.name}' มีอยู่แล้ว")
 
@@ -106,41 +147,58 @@ def update_room(db: Session, room_id: int, room_update: RoomUpdate) -> Optional[
     for field, value in update_data.items():
         setattr(db_room, field, value)
 
-    db.commit()  # commit to db
-    db.refresh(db_room)
+    await db.commit()  # commit to db
+    invalidate_room_cache(room_id)
     return db_room
 
 
-def delete_room(db: Session, room_id: int) -> bool:  # ลบห้อง
-    db_room = db.query(Room).filter(Room.id == room_id).first()
+async def delete_room(db: AsyncSession, room_id: int) -> bool:  # ลบห้อง
+    db_room = await get_room(db, room_id)
     if not db_room:
         return False
 
-    future_bookings = db.query(Booking).filter(  # check การจองล่วงหน้า
-        and_(
-            Booking.room_id == room_id,
-            Booking.start_datetime > datetime.utcnow(),
-            Booking.is_cancelled == False
-        )
-    ).count()
+    future_bookings = and_(  # check การจองล่วงหน้า
+        Booking.room_id == room_id,
+        Booking.start_datetime > datetime.utcnow(),
+        Booking.is_cancelled == False
+    )
 
-    if future_bookings > 0:
-        raise ValueError(f"ไม่สามารถลบห้องได้ มีการจอง {future_bookings} อยู่")
+    if (await db.execute(select(exists().where(future_bookings)))).scalar():
+        # นับจำนวนเฉพาะตอนที่ลบไม่ได้
+        count = (await db.execute(select(func.count()).select_from(Booking).where(future_bookings))).scalar()
+        raise ValueError(f"ไม่สามารถลบห้องได้ มีการจอง {count} อยู่")
 
     db_room.is_active = False
-    db.commit()
+    await db.commit()
+    invalidate_room_cache(room_id)
     return True
 
 
-def check_room_availability(  # check ว่าห้องว่างไหม
-        db: Session,
+async def check_room_availability(  # check ว่าห้องว่างไหม
+        db: AsyncSession,
         room_id: int,
         start_datetime: datetime,
         end_datetime: datetime,
         exclude_booking_id: Optional[int] = None
 ) -> RoomAvailability:
-    room = db.query(Room).filter(Room.id == room_id).first()
+    conflict_conditions = [
+        Booking.room_id == Room.id,
+        Booking.is_cancelled == False,
+        # ตรวจสอบการจองทับ
+        Booking.start_datetime < end_datetime,
+        Booking.end_datetime > start_datetime
+    ]
+
+    if exclude_booking_id:
+        conflict_conditions.append(Booking.id != exclude_booking_id)
+
+    # ดึงห้องพร้อมการจองที่ทับ (ถ้ามี) ใน query เดียว
+    stmt = select(Room, Booking).outerjoin(
+        Booking, and_(*conflict_conditions)
+    ).where(Room.id == room_id).limit(1)
+    row = (await db.execute(stmt)).first()
 
+    room, conflicting_booking = row if row else (None, None)
     result = RoomAvailability(
         room_id=room_id,
         room_name=room.name if room else "ไม่พบห้อง",
@@ -165,21 +223,6 @@ def check_room_availability(  # check ว่าห้องว่างไหม
         result.reason = f"นอกเวลาทำการ ({room.start_time.strftime('%H:%M')} - {room.end_time.strftime('%H:%M')})"
         return result
 
-    query = db.query(Booking).filter(
-        and_(
-            Booking.room_id == room_id,
-            Booking.is_cancelled == False,
-            # ตรวจสอบการจองทับ
-            Booking.start_datetime < end_datetime,
-            Booking.end_datetime > start_datetime
-        )
-    )
-
-    if exclude_booking_id:
-        query = query.filter(Booking.id != exclude_booking_id)
-
-    conflicting_booking = query.first()
-
     if conflicting_booking:
         result.reason = f"มีการจองแล้ว: {conflicting_booking.title} ({conflicting_booking.start_datetime.strftime('%H:%M')}-{conflicting_booking.end_datetime.strftime('%H:%M')})"
         return result
@@ -188,37 +231,45 @@ def check_room_availability(  # check ว่าห้องว่างไหม
     return result
 
 
-def find_available_rooms(  #หาห่องว่าง
-        db: Session,
+async def find_available_rooms(  #หาห่องว่าง
+        db: AsyncSession,
         start_datetime: datetime,
         end_datetime: datetime,
         min_capacity: Optional[int] = None
 ) -> List[Room]:
-    query = db.query(Room).filter(Room.is_active == True)
-
-    if min_capacity:
-        query = query.filter(Room.capacity >= min_capacity)
+    conflicting_booking = exists().where(
+        and_(
+            Booking.room_id == Room.id,
+            Booking.is_cancelled == False,
+            # ตรวจสอบการจองทับ
+            Booking.start_datetime < end_datetime,
+            Booking.end_datetime > start_datetime
+        )
+    )
 
-    rooms = query.all()
-    available_rooms = []
+    stmt = select(Room).where(
+        Room.is_active == True,
+        Room.start_time <= start_datetime.time(),
+        Room.end_time >= end_datetime.time(),
+        ~conflicting_booking
+    )
 
-    for room in rooms:
-        availability = check_room_availability(db, room.id, start_datetime, end_datetime)
-        if availability.is_available:
-            available_rooms.append(room)
+    if min_capacity:
+        stmt = stmt.where(Room.capacity >= min_capacity)
 
-    return available_rooms
+    return (await db.execute(stmt)).scalars().all()
 
 
-def get_room_schedule(db: Session, room_id: int, date: datetime.date) -> List[Booking]: #ดูการจองห้อง
-    start_of_day = datetime.combine(date, datetime.min.time())
-    end_of_day = datetime.combine(date, datetime.max.time())
+async def get_room_schedule(db: AsyncSession, room_id: int, date: datetime.date) -> List[Booking]: #ดูการจองห้อง
+    start_of_day = datetime.combine(date, _DAY_START)
+    end_of_day = datetime.combine(date, _DAY_END)
 
-    return db.query(Booking).filter(
+    stmt = select(Booking).options(*BOOKING_SUMMARY_OPTIONS).where(
         and_(
             Booking.room_id == room_id,
             Booking.start_datetime >= start_of_day,
             Booking.start_datetime <= end_of_day,
             Booking.is_cancelled == False
         )
-    ).order_by(Booking.start_datetime).all()
\ No newline at end of file
+    ).order_by(Booking.start_datetime)
+    return (await db.execute(stmt)).scalars().all()
\ No newline at end of file
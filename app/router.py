@@ -1,20 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import date, datetime
+import hashlib
 import traceback
 
-from config.config import get_db
+from app.config.config import get_db
 
 # Import functions
-from modules.room.room import (
+from app.modules.room.room import (
     RoomCreate, RoomUpdate, RoomResponse, RoomAvailability,
     create_room, get_rooms, get_room, update_room, delete_room,
     check_room_availability, find_available_rooms, get_room_schedule
 )
 
-from modules.booking.booking import (
-    BookingCreate, BookingUpdate, BookingResponse,
+from app.modules.booking.booking import (
+    BookingCreate, BookingUpdate, BookingResponse, BookingSummaryResponse,
     create_booking, get_bookings, get_booking, update_booking,
     cancel_booking, get_upcoming_bookings, get_today_bookings,
     get_my_bookings, search_bookings
@@ -22,38 +24,71 @@ from modules.booking.booking import (
 
 router = APIRouter()
 
+READ_CACHE_MAX_AGE = 30  # วินาที
+
+_room_adapter = TypeAdapter(RoomResponse)
+_room_list_adapter = TypeAdapter(List[RoomResponse])
+_booking_summary_list_adapter = TypeAdapter(List[BookingSummaryResponse])
+
+
+# response สำหรับ GET ที่อ่านอย่างเดียว: ใส่ Cache-Control + ETag และตอบ 304 ถ้า client มีข้อมูลเดิมอยู่แล้ว
+def cached_response(request: Request, adapter: TypeAdapter, data) -> Response:
+    body = adapter.dump_json(adapter.validate_python(data))
+    etag = f'"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+    headers = {"Cache-Control": f"public, max-age={READ_CACHE_MAX_AGE}", "ETag": etag}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 # สร้างห้อง
 @router.post("/rooms/", response_model=RoomResponse, tags=["Rooms"])
-def create_room_endpoint(room: RoomCreate, db: Session = Depends(get_db)):
+async def create_room_endpoint(room: RoomCreate, db: AsyncSession = Depends(get_db)):
     try:
-        return create_room(db, room)
+        return await create_room(db, room)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/rooms/", response_model=List[RoomResponse], tags=["Rooms"])
-def get_rooms_endpoint(
+async def get_rooms_endpoint(
+        request: Request,
         skip: int = 0,
         limit: int = 100,
         active_only: bool = True,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_db)
 ):
-    return get_rooms(db, skip=skip, limit=limit, active_only=active_only)
+    rooms = await get_rooms(db, skip=skip, limit=limit, active_only=active_only)
+    return cached_response(request, _room_list_adapter, rooms)
+
 
+# หาห้องที่ว่าง
+@router.get("/rooms/available/", response_model=List[RoomResponse], tags=["Rooms"])
+async def find_available_rooms_endpoint(
+        start_datetime: datetime,
+        end_datetime: datetime,
+        min_capacity: Optional[int] = None,
+        db: AsyncSession = Depends(get_db)
+):
+    return await find_available_rooms(db, start_datetime, end_datetime, min_capacity)
 
+
+# route ที่มี {room_id} ต้องอยู่หลัง /rooms/available/
 @router.get("/rooms/{room_id}", response_model=RoomResponse, tags=["Rooms"])
-def get_room_endpoint(room_id: int, db: Session = Depends(get_db)):
-    room = get_room(db, room_id)
+async def get_room_endpoint(room_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    room = await get_room(db, room_id)
     if not room:
         raise HTTPException(status_code=404, detail="ไม่พบห้องประชุม")
-    return room
+    return cached_response(request, _room_adapter, room)
 
 
 @router.put("/rooms/{room_id}", response_model=RoomResponse, tags=["Rooms"])
-def update_room_endpoint(room_id: int, room_update: RoomUpdate, db: Session = Depends(get_db)):
+async def update_room_endpoint(room_id: int, room_update: RoomUpdate, db: AsyncSession = Depends(get_db)):
     try:
-        room = update_room(db, room_id, room_update)
+        room = await update_room(db, room_id, room_update)
         if not room:
             raise HTTPException(status_code=404, detail="ไม่พบห้องประชุม")
         return room
@@ -62,9 +97,9 @@ def update_room_endpoint(room_id: int, room_update: RoomUpdate, db: Session = De
 
 
 @router.delete("/rooms/{room_id}", tags=["Rooms"])
-def delete_room_endpoint(room_id: int, db: Session = Depends(get_db)):
+async def delete_room_endpoint(room_id: int, db: AsyncSession = Depends(get_db)):
     try:
-        success = delete_room(db, room_id)
+        success = await delete_room(db, room_id)
         if not success:
             raise HTTPException(status_code=404, detail="ไม่พบห้องประชุม")
         return {"message": "ลบห้องเรียบร้อยแล้ว"}
@@ -74,50 +109,39 @@ def delete_room_endpoint(room_id: int, db: Session = Depends(get_db)):
 
 # เช็คว่าห้องว่างไหม
 @router.get("/rooms/{room_id}/availability", response_model=RoomAvailability, tags=["Rooms"])
-def check_availability_endpoint(
+async def check_availability_endpoint(
         room_id: int,
         start_datetime: datetime,
         end_datetime: datetime,
-        db: Session = Depends(get_db)
-):
-    return check_room_availability(db, room_id, start_datetime, end_datetime)
-
-
-# หาห้องที่ว่าง
-@router.get("/rooms/available/", response_model=List[RoomResponse], tags=["Rooms"])
-def find_available_rooms_endpoint(
-        start_datetime: datetime,
-        end_datetime: datetime,
-        min_capacity: Optional[int] = None,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_db)
 ):
-    return find_available_rooms(db, start_datetime, end_datetime, min_capacity)
+    return await check_room_availability(db, room_id, start_datetime, end_datetime)
 
 
 # ค้นหาตารางการจองตามตาราง#
-@router.get("/rooms/{room_id}/schedule", tags=["Rooms"])
-def get_room_schedule_endpoint(
+@router.get("/rooms/{room_id}/schedule", response_model=List[BookingSummaryResponse], tags=["Rooms"])
+async def get_room_schedule_endpoint(
         room_id: int,
         target_date: date,
-        db: Session = Depends(get_db)
+        request: Request,
+        db: AsyncSession = Depends(get_db)
 ):
-    bookings = get_room_schedule(db, room_id, target_date)
-    # Convert to BookingResponse format
-    return [BookingResponse.from_booking(booking) for booking in bookings]
+    bookings = await get_room_schedule(db, room_id, target_date)
+    return cached_response(request, _booking_summary_list_adapter, bookings)
 
 
 @router.post("/bookings/", response_model=BookingResponse, tags=["Bookings"])
-def create_booking_endpoint(booking: BookingCreate, db: Session = Depends(get_db)):
+async def create_booking_endpoint(booking: BookingCreate, db: AsyncSession = Depends(get_db)):
     try:
-        db_booking = create_booking(db, booking)
-        return BookingResponse.from_booking(db_booking)
+        db_booking = await create_booking(db, booking)
+        return db_booking
     except Exception as e:
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/bookings/", response_model=List[BookingResponse], tags=["Bookings"])
-def get_bookings_endpoint(
+async def get_bookings_endpoint(
         skip: int = 0,
         limit: int = 100,
         room_id: Optional[int] = None,
@@ -125,78 +149,79 @@ def get_bookings_endpoint(
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
         include_cancelled: bool = False,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_db)
 ):
-    bookings = get_bookings(
+    bookings = await get_bookings(
         db, skip=skip, limit=limit, room_id=room_id,
         organizer_email=organizer_email, start_date=start_date,
         end_date=end_date, include_cancelled=include_cancelled
     )
-    return [BookingResponse.from_booking(booking) for booking in bookings]
+    return bookings
+
+
+# การจองล่วงหน้า/ที่กำลังจะถึง
+@router.get("/bookings/upcoming/", response_model=List[BookingSummaryResponse], tags=["Bookings"])
+async def get_upcoming_bookings_endpoint(request: Request, days: int = 7, db: AsyncSession = Depends(get_db)):
+    bookings = await get_upcoming_bookings(db, days)
+    return cached_response(request, _booking_summary_list_adapter, bookings)
 
 
+# today booking
+@router.get("/bookings/today/", response_model=List[BookingSummaryResponse], tags=["Bookings"])
+async def get_today_bookings_endpoint(request: Request, db: AsyncSession = Depends(get_db)):
+    bookings = await get_today_bookings(db)
+    return cached_response(request, _booking_summary_list_adapter, bookings)
+
+
+# get my booking
+@router.get("/bookings/my/", response_model=List[BookingResponse], tags=["Bookings"])
+async def get_my_bookings_endpoint(organizer_email: str, db: AsyncSession = Depends(get_db)):
+    bookings = await get_my_bookings(db, organizer_email)
+    return bookings
+
+
+# ค้นหากาารจอง
+@router.get("/bookings/search/", response_model=List[BookingResponse], tags=["Bookings"])
+async def search_bookings_endpoint(q: str, db: AsyncSession = Depends(get_db)):
+    bookings = await search_bookings(db, q)
+    return bookings
+
+
+# route ที่มี {booking_id} ต้องอยู่หลัง path คงที่ข้างบน ไม่งั้นจะถูก match ก่อน
 @router.get("/bookings/{booking_id}", response_model=BookingResponse, tags=["Bookings"])
-def get_booking_endpoint(booking_id: int, db: Session = Depends(get_db)):
-    booking = get_booking(db, booking_id)
+async def get_booking_endpoint(booking_id: int, db: AsyncSession = Depends(get_db)):
+    booking = await get_booking(db, booking_id)
     if not booking:
         raise HTTPException(status_code=404, detail="ไม่พบการจอง")
-    return BookingResponse.from_booking(booking)
+    return booking
 
 
 # แก้ไขการจอง
 @router.put("/bookings/{booking_id}", response_model=BookingResponse, tags=["Bookings"])
-def update_booking_endpoint(
+async def update_booking_endpoint(
         booking_id: int,
         booking_update: BookingUpdate,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_db)
 ):
     try:
-        booking = update_booking(db, booking_id, booking_update)
+        booking = await update_booking(db, booking_id, booking_update)
         if not booking:
             raise HTTPException(status_code=404, detail="ไม่พบการจอง")
-        return BookingResponse.from_booking(booking)
+        return booking
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.delete("/bookings/{booking_id}", tags=["Bookings"])
-def cancel_booking_endpoint(
+async def cancel_booking_endpoint(
         booking_id: int,
         reason: Optional[str] = None,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_db)
 ):
     try:
-        booking = cancel_booking(db, booking_id, reason)
+        booking = await cancel_booking(db, booking_id, reason)
         if not booking:
             raise HTTPException(status_code=404, detail="ไม่พบการจอง")
         return {"message": "ยกเลิกการจองแล้ว", "booking_id": booking.id}
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-
-
-# การจองล่วงหน้า/ที่กำลังจะถึง
-@router.get("/bookings/upcoming/", response_model=List[BookingResponse], tags=["Bookings"])
-def get_upcoming_bookings_endpoint(days: int = 7, db: Session = Depends(get_db)):
-    bookings = get_upcoming_bookings(db, days)
-    return [BookingResponse.from_booking(booking) for booking in bookings]
-
-
-# today booking
-@router.get("/bookings/today/", response_model=List[BookingResponse], tags=["Bookings"])
-def get_today_bookings_endpoint(db: Session = Depends(get_db)):
-    bookings = get_today_bookings(db)
-    return [BookingResponse.from_booking(booking) for booking in bookings]
-
-
-# get my booking
-@router.get("/bookings/my/", response_model=List[BookingResponse], tags=["Bookings"])
-def get_my_bookings_endpoint(organizer_email: str, db: Session = Depends(get_db)):
-    bookings = get_my_bookings(db, organizer_email)
-    return [BookingResponse.from_booking(booking) for booking in bookings]
-
-
-# ค้นหากาารจอง
-@router.get("/bookings/search/", response_model=List[BookingResponse], tags=["Bookings"])
-def search_bookings_endpoint(q: str, db: Session = Depends(get_db)):
-    bookings = search_bookings(db, q)
-    return [BookingResponse.from_booking(booking) for booking in bookings]
@@ -1,86 +1,154 @@
+import functools
+import io
+import itertools
 import os
 import sys
+import types
 from datetime import datetime, time, timedelta
 from dotenv import load_dotenv
 
-load_dotenv()
+# โหลด .env ครั้งเดียวต่อ process (กัน import ซ้ำ เช่นตอน autoreload)
+if not os.environ.get("_DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
 
 sys.path.append('/app')
-sys.path.append('/app/app')
 
-if os.getenv("DB_HOST"):
-    from sqlalchemy import create_engine
-    from sqlalchemy.orm import sessionmaker
-
-    from models.booking import Base, Room, Booking
 
-    DB_HOST = os.getenv("DB_HOST")
-    DB_PORT = os.getenv("DB_PORT")
-    DB_USERNAME = os.getenv("DB_USERNAME")
-    DB_PASSWORD = os.getenv("DB_PASSWORD")
-    DB_NAME = os.getenv("DB_NAME")
-
-    print(f" Environment variables loaded:")
-    print(f"   DB_HOST: {DB_HOST}")
-    print(f"   DB_PORT: {DB_PORT}")
-    print(f"   DB_NAME: {DB_NAME}")
-    print(f"   DB_USERNAME: {DB_USERNAME}")
+@functools.lru_cache(maxsize=1)
+def _db_cfg():
+    return types.SimpleNamespace(
+        host=os.getenv("DB_HOST"),
+        port=os.getenv("DB_PORT"),
+        username=os.getenv("DB_USERNAME"),
+        password=os.getenv("DB_PASSWORD"),
+        name=os.getenv("DB_NAME"),
+    )
+
+
+# เช็คและแสดง config ครั้งเดียวต่อ process
+@functools.lru_cache(maxsize=1)
+def _check_db_cfg():
+    cfg = _db_cfg()
+    if cfg.host:
+        # env ไม่ครบให้จบทันที ไม่ต้องไปรอ retry กับ URL ที่ใช้ไม่ได้
+        missing = [f"DB_{k.upper()}" for k, v in vars(cfg).items() if not v]
+        if missing:
+            sys.exit(f"missing env: {missing}")
+
+        print(f" Environment variables loaded:")
+        print(f"   DB_HOST: {cfg.host}")
+        print(f"   DB_PORT: {cfg.port}")
+        print(f"   DB_NAME: {cfg.name}")
+        print(f"   DB_USERNAME: {cfg.username}")
+        print(f"🐳 Docker mode - Connecting to: {cfg.host}:{cfg.port}")
+    else:
+        print("Local mode - Using config.config")
 
-    DATABASE_URL = f"postgresql://{DB_USERNAME}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
-    print(f"🐳 Docker mode - Connecting to: {DB_HOST}:{DB_PORT}")
-    engine = create_engine(DATABASE_URL, echo=False)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-else:
+# import sqlalchemy/model เมื่อมีคำสั่งที่ต้องใช้ DB จริงเท่านั้น
+# URL และ engine (cache ไว้แล้ว) สร้างที่ config.config ที่เดียว ใช้ทั้ง Docker และ local
+def _get_engine():
+    _check_db_cfg()
     try:
-        from app.config.config import engine, SessionLocal
-        from app.models.booking import Base, Room, Booking
-
-        print("Local mode - Using config.config")
+        from app.config.config import get_engine
     except ImportError as e:
         print(f"Error importing config: {e}")
         print("Make sure you're running from the project root directory")
         sys.exit(1)
 
+    return get_engine()
+
 
 def wait_for_database():
+    import random
     import time
+    from sqlalchemy import create_engine
     from sqlalchemy.exc import OperationalError
+    from sqlalchemy.pool import NullPool
 
     max_retries = 30
-    retry_count = 0
+    delay = 0.1
 
-    while retry_count < max_retries:
-        try:
-            connection = engine.connect()
-            connection.close()
-            print("Database connection successful!")
-            return True
-        except OperationalError:
-            retry_count += 1
-            print(f"Waiting for database... (attempt {retry_count}/{max_retries})")
-            time.sleep(2)
+    # engine แยกที่ timeout สั้น ๆ และไม่มี pool ใช้แค่เช็คว่า DB พร้อม แล้วทิ้งไป
+    # ไม่ให้ connection ที่ล้มเหลวไปค้างใน pool ของ engine หลัก
+    probe = create_engine(_get_engine().url, poolclass=NullPool, connect_args={"connect_timeout": 2})
+
+    try:
+        for attempt in range(1, max_retries + 1):
+            try:
+                probe.connect().close()
+                print("Database connection successful!")
+                return True
+            except OperationalError:
+                print(f"Waiting for database... (attempt {attempt}/{max_retries})")
+                # exponential backoff + jitter
+                time.sleep(delay + random.uniform(0, delay * 0.25))
+                delay = min(delay * 1.8, 5.0)
+    finally:
+        probe.dispose()
 
     print("Failed to connect to database")
     return False
 
 
-def ensure_cancellation_reason_column():
-    from sqlalchemy import inspect, text
-    inspector = inspect(engine)
-    columns = [col['name'] for col in inspector.get_columns('booking')]
-    if 'cancellation_reason' not in columns:
-        print("Adding missing 'cancellation_reason' column to 'booking' table...")
-        with engine.connect() as conn:
-            conn.execute(text("ALTER TABLE booking ADD COLUMN cancellation_reason TEXT;"))
-        print("Column 'cancellation_reason' added.")
+def ensure_pg_trgm_extension(conn):
+    from sqlalchemy import text
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+
+def ensure_cancellation_reason_column(conn):
+    from sqlalchemy import text
+    # ฐานข้อมูลเก่าอาจยังไม่มี column นี้
+    conn.execute(text("ALTER TABLE booking ADD COLUMN IF NOT EXISTS cancellation_reason TEXT"))
+
+
+def ensure_booking_indexes():
+    from sqlalchemy import text
+    from sqlalchemy.schema import CreateIndex
+    from app.models.booking import Booking
+
+    # create_all ไม่เพิ่ม index ให้ตารางที่มีอยู่แล้ว: ดึงสถานะ index ที่มีด้วย query เดียว แล้วสร้างเฉพาะที่ขาด
+    # ใช้ CONCURRENTLY ไม่ lock การเขียนถ้าตารางมีข้อมูลอยู่แล้ว (ต้องรันนอก transaction จึงใช้ AUTOCOMMIT)
+    with _get_engine().execution_options(isolation_level="AUTOCOMMIT").connect() as conn:
+        existing = dict(conn.execute(
+            text(
+                "SELECT i.relname, x.indisvalid FROM pg_index x "
+                "JOIN pg_class i ON i.oid = x.indexrelid "
+                "JOIN pg_class t ON t.oid = x.indrelid "
+                "JOIN pg_namespace n ON n.oid = t.relnamespace "
+                "WHERE n.nspname = current_schema() AND t.relname = :table"
+            ),
+            {"table": Booking.__tablename__}
+        ).all())
+        for index in Booking.__table__.indexes:
+            if existing.get(index.name):
+                continue
+            # CONCURRENTLY ที่ล้มกลางทางจะทิ้ง index INVALID ไว้ในชื่อเดิม (planner ไม่ใช้) ต้องลบก่อนสร้างใหม่
+            if index.name in existing:
+                conn.exec_driver_sql(f"DROP INDEX CONCURRENTLY {conn.dialect.identifier_preparer.quote(index.name)}")
+            ddl = str(CreateIndex(index).compile(dialect=conn.dialect))
+            conn.exec_driver_sql(ddl.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1))
 
 
 def create_tables():
+    from sqlalchemy import text
+    from app.models.booking import Base
+
     try:
         print("Creating database tables...")
-        Base.metadata.create_all(bind=engine)
-        ensure_cancellation_reason_column()
+        with _get_engine().begin() as conn:
+            ensure_pg_trgm_extension(conn)
+            # เช็คตารางที่มีอยู่แล้วด้วย query เดียว แทน has_table ทีละตาราง
+            existing = {row[0] for row in conn.execute(
+                text("SELECT tablename FROM pg_tables WHERE schemaname = current_schema()")
+            )}
+            to_create = [table for table in Base.metadata.sorted_tables if table.name not in existing]
+            if to_create:
+                Base.metadata.create_all(bind=conn, tables=to_create, checkfirst=False)
+            # DDL ทั้งหมดใช้ connection/transaction เดียวกัน
+            ensure_cancellation_reason_column(conn)
+        ensure_booking_indexes()
         print("Database tables created successfully!")
         return True
     except Exception as e:
@@ -89,9 +157,12 @@ def create_tables():
 
 
 def drop_tables():
+    from app.models.booking import Base
+
     try:
         print("Dropping all tables...")
-        Base.metadata.drop_all(bind=engine)
+        with _get_engine().begin() as conn:
+            Base.metadata.drop_all(bind=conn)
         print("All tables dropped!")
         return True
     except Exception as e:
@@ -100,11 +171,15 @@ def drop_tables():
 
 
 def reset_database():
+    from app.models.booking import Base
+
     try:
         print("Resetting database...")
-        Base.metadata.drop_all(bind=engine)
-        Base.metadata.create_all(bind=engine)
-        ensure_cancellation_reason_column()
+        # drop + create ใน transaction เดียว; create_all สร้าง cancellation_reason จาก model อยู่แล้ว
+        with _get_engine().begin() as conn:
+            Base.metadata.drop_all(bind=conn)
+            ensure_pg_trgm_extension(conn)
+            Base.metadata.create_all(bind=conn)
         print("Database reset successfully!")
         return True
     except Exception as e:
@@ -112,102 +187,244 @@ def reset_database():
         return False
 
 
-def create_sample_data():
-    db = SessionLocal()
+_SAMPLE_ROOMS = [
+    dict(
+        name="ห้องประชุมใหญ่",
+        capacity=20,
+        location="ชั้น 2 อาคาร A",
+        description="ห้องประชุมหลักสำหรับการประชุมใหญ่ พร้อมโปรเจกเตอร์และระบบเสียง",
+        start_time=time(8, 0),
+        end_time=time(18, 0)
+    ),
+    dict(
+        name="ห้องประชุมเล็ก 1",
+        capacity=6,
+        location="ชั้น 3 อาคาร A",
+        description="ห้องประชุมขนาดเล็กสำหรับทีมงาน พร้อมกระดานไวท์บอร์ด",
+        start_time=time(8, 0),
+        end_time=time(18, 0)
+    ),
+    dict(
+        name="ห้องประชุมเล็ก 2",
+        capacity=8,
+        location="ชั้น 3 อาคาร A",
+        description="ห้องประชุมขนาดเล็กสำหรับการประชุมแผนก",
+        start_time=time(8, 0),
+        end_time=time(18, 0)
+    )
+]
+
+_BATCH_SIZE = 1000
+_SUMMARY_LIMIT = 10
+
+
+def _batches(rows, size=_BATCH_SIZE):
+    it = iter(rows)
+    while batch := list(itertools.islice(it, size)):
+        yield batch
+
+
+# ใส่ค่า default ของ model (is_active, created_at) เองทุกแถว: INSERT ... SELECT สองตารางใน statement เดียว
+# SQLAlchemy สร้างชื่อ bind ของ default ฝั่ง Python ชนกัน (created_at ทั้ง room และ booking)
+def _generate_rooms(n_rooms, now):
+    defaults = dict(is_active=True, created_at=now)
+    rooms = [room | defaults for room in _SAMPLE_ROOMS[:n_rooms]]
+    rooms.extend(
+        dict(
+            name=f"ห้องประชุมทดสอบ {i}",
+            capacity=4 + i % 17,
+            location=f"ชั้น {1 + i % 10} อาคาร B",
+            description="ห้องที่สร้างอัตโนมัติสำหรับทดสอบ",
+            start_time=time(8, 0),
+            end_time=time(18, 0),
+            **defaults
+        )
+        for i in range(len(rooms) + 1, n_rooms + 1)
+    )
+    return rooms
+
+
+# ผูก booking กับห้องด้วยชื่อ เพราะตอนสร้างยังไม่รู้ id ของห้อง
+def _generate_bookings(room_names, n_bookings, now):
+    # บวก timedelta จากเที่ยงคืนพรุ่งนี้ แทน replace ทีละค่า
+    tomorrow0 = datetime.combine((now + timedelta(days=1)).date(), time.min)
+    defaults = dict(is_cancelled=False, created_at=now, updated_at=now)
+
+    bookings = [
+        dict(
+            room_name=room_names[0],
+            title="Daily Scrum Meeting",
+            organizer_name="เอ็มม่า วัดท่าไม้",
+            organizer_email="emma@company.com",
+            participant_count=8,
+            start_datetime=tomorrow0 + timedelta(hours=9),
+            end_datetime=tomorrow0 + timedelta(hours=10),
+            description="ประชุมติดตามงานประจำวันของทีม Development",
+            **defaults
+        ),
+        dict(
+            room_name=room_names[1 % len(room_names)],
+            title="สัมภาษณ์งาน - Frontend Developer",
+            organizer_name="น้องแจน แจนแจน",
+            organizer_email="jan@company.com",
+            participant_count=3,
+            start_datetime=tomorrow0 + timedelta(hours=14),
+            end_datetime=tomorrow0 + timedelta(hours=15, minutes=30),
+            description="สัมภาษณ์ผู้สมัครตำแหน่ง Frontend Developer",
+            **defaults
+        )
+    ][:n_bookings]
+
+    # ที่เหลือกระจายไปทุกห้อง ห้องละ 10 ช่อง (08:00-18:00) ต่อวัน เริ่มวันมะรืน ไม่ชนกัน
+    day_start = tomorrow0 + timedelta(days=1, hours=8)
+    for i in range(n_bookings - len(bookings)):
+        slot = i // len(room_names)
+        start = day_start + timedelta(days=slot // 10, hours=slot % 10)
+        bookings.append(dict(
+            room_name=room_names[i % len(room_names)],
+            title=f"Sample Meeting {i + 1}",
+            organizer_name="ผู้ทดสอบระบบ",
+            organizer_email=f"tester{i % 100}@company.com",
+            participant_count=2,
+            start_datetime=start,
+            end_datetime=start + timedelta(hours=1),
+            description="การจองที่สร้างอัตโนมัติสำหรับทดสอบ",
+            **defaults
+        ))
+    return bookings
+
+
+def _summary_lines(rows, fmt):
+    lines = [fmt(i, row) for i, row in enumerate(rows[:_SUMMARY_LIMIT], 1)]
+    if len(rows) > _SUMMARY_LIMIT:
+        lines.append(f"  ... และอีก {len(rows) - _SUMMARY_LIMIT} รายการ")
+    return "\n".join(lines)
+
+
+def _has_rooms(conn):
+    from sqlalchemy import select
+    from app.models.booking import Room
+
+    # แค่เช็คว่ามีห้องอยู่แล้วหรือไม่ ไม่ต้อง count ทั้งตาราง
+    return conn.execute(select(Room.__table__.c.id).limit(1)).first() is not None
+
+
+def _seed_statement(rooms, bookings):
+    from sqlalchemy import column, exists, func, insert, literal, select, values
+    from app.models.booking import Room, Booking
+
+    room_table = Room.__table__
+    booking_table = Booking.__table__
+
+    # WITH ins_rooms AS (INSERT ... WHERE NOT EXISTS (ห้องเดิม) RETURNING id, name),
+    #      ins_bookings AS (INSERT ... SELECT ... JOIN ins_rooms RETURNING id)
+    # SELECT จำนวนที่ insert ได้ -> เช็คข้อมูลเดิม + insert ทั้งหมดใน round-trip เดียว
+    room_cols = list(rooms[0])
+    room_values = values(
+        *(column(k, room_table.c[k].type) for k in room_cols), name="room_values"
+    ).data([tuple(room[k] for k in room_cols) for room in rooms])
+    ins_rooms = (
+        insert(room_table)
+        .from_select(room_cols, select(room_values).where(~exists(select(room_table.c.id))))
+        .returning(room_table.c.id, room_table.c.name)
+        .cte("ins_rooms")
+    )
+    room_count = select(func.count()).select_from(ins_rooms).scalar_subquery()
+    if not bookings:
+        return select(room_count, literal(0))
+
+    booking_cols = [k for k in bookings[0] if k != "room_name"]
+    booking_values = values(
+        column("room_name", room_table.c.name.type),
+        *(column(k, booking_table.c[k].type) for k in booking_cols),
+        name="booking_values"
+    ).data([(booking["room_name"], *(booking[k] for k in booking_cols)) for booking in bookings])
+    ins_bookings = (
+        insert(booking_table)
+        .from_select(
+            ["room_id", *booking_cols],
+            select(ins_rooms.c.id, *(booking_values.c[k] for k in booking_cols))
+            .join_from(booking_values, ins_rooms, ins_rooms.c.name == booking_values.c.room_name)
+        )
+        .returning(booking_table.c.id)
+        .cte("ins_bookings")
+    )
+    return select(room_count, select(func.count()).select_from(ins_bookings).scalar_subquery())
+
+
+def _insert_in_batches(conn, rooms, bookings):
+    from app.models.booking import Room, Booking
+
+    room_table = Room.__table__
+    booking_table = Booking.__table__
+
+    if _has_rooms(conn):
+        return 0, 0
+
+    insert_rooms = room_table.insert().returning(room_table.c.id, sort_by_parameter_order=True)
+    room_ids = {}
+    for batch in _batches(rooms):
+        room_ids.update(zip((room["name"] for room in batch), conn.scalars(insert_rooms, batch)))
+
+    rows = (
+        {k: v for k, v in booking.items() if k != "room_name"} | {"room_id": room_ids[booking["room_name"]]}
+        for booking in bookings
+    )
+    for batch in _batches(rows):
+        conn.execute(booking_table.insert(), batch)
+    return len(rooms), len(bookings)
+
+
+def create_sample_data(n_rooms=3, n_bookings=2):
+    from sqlalchemy import text
 
     try:
         print("Creating sample data...")
 
-        existing_rooms = db.query(Room).count()
-        if existing_rooms > 0:
-            print(f"Found {existing_rooms} existing rooms, skipping sample data")
+        now = datetime.now()
+        rooms = _generate_rooms(n_rooms, now)
+        if not rooms:
             return True
+        bookings = _generate_bookings([room["name"] for room in rooms], n_bookings, now)
 
-        rooms = [
-            Room(
-                name="ห้องประชุมใหญ่",
-                capacity=20,
-                location="ชั้น 2 อาคาร A",
-                description="ห้องประชุมหลักสำหรับการประชุมใหญ่ พร้อมโปรเจกเตอร์และระบบเสียง",
-                start_time=time(8, 0),
-                end_time=time(18, 0)
-            ),
-            Room(
-                name="ห้องประชุมเล็ก 1",
-                capacity=6,
-                location="ชั้น 3 อาคาร A",
-                description="ห้องประชุมขนาดเล็กสำหรับทีมงาน พร้อมกระดานไวท์บอร์ด",
-                start_time=time(8, 0),
-                end_time=time(18, 0)
-            ),
-            Room(
-                name="ห้องประชุมเล็ก 2",
-                capacity=8,
-                location="ชั้น 3 อาคาร A",
-                description="ห้องประชุมขนาดเล็กสำหรับการประชุมแผนก",
-                start_time=time(8, 0),
-                end_time=time(18, 0)
-            )
-        ]
-
-        for room in rooms:
-            db.add(room)
-
-        db.commit()
-        print(f"Created {len(rooms)} rooms")
+        # seed เป็น insert ล้วน ใช้ Core connection ตรง ๆ ไม่ต้องมี Session/identity map
+        with _get_engine().begin() as conn:
+            # ข้อมูลตัวอย่างสร้างใหม่ได้เสมอ ไม่ต้องรอ WAL flush ตอน commit
+            conn.execute(text("SET LOCAL synchronous_commit = off"))
 
-        now = datetime.now()
-        tomorrow = now + timedelta(days=1)
-        day_after = now + timedelta(days=2)
-
-        bookings = [
-            Booking(
-                room_id=1,
-                title="Daily Scrum Meeting",
-                organizer_name="เอ็มม่า วัดท่าไม้",
-                organizer_email="emma@company.com",
-                participant_count=8,
-                start_datetime=tomorrow.replace(hour=9, minute=0, second=0, microsecond=0),
-                end_datetime=tomorrow.replace(hour=10, minute=0, second=0, microsecond=0),
-                description="ประชุมติดตามงานประจำวันของทีม Development"
-            ),
-            Booking(
-                room_id=2,
-                title="สัมภาษณ์งาน - Frontend Developer",
-                organizer_name="น้องแจน แจนแจน",
-                organizer_email="jan@company.com",
-                participant_count=3,
-                start_datetime=tomorrow.replace(hour=14, minute=0, second=0, microsecond=0),
-                end_datetime=tomorrow.replace(hour=15, minute=30, second=0, microsecond=0),
-                description="สัมภาษณ์ผู้สมัครตำแหน่ง Frontend Developer"
-            )
-        ]
-
-        for booking in bookings:
-            db.add(booking)
-
-        db.commit()
-        print(f"Created {len(bookings)} sample bookings")
-
-        print("\nSample Data Summary:")
-        print("=" * 50)
-        print("Rooms:")
-        for i, room in enumerate(rooms, 1):
-            print(f"  {i}. {room.name} (ความจุ: {room.capacity} คน) - {room.location}")
-
-        print("\nBookings:")
-        for i, booking in enumerate(bookings, 1):
-            print(f"  {i}. {booking.title} - {booking.start_datetime.strftime('%d/%m/%Y %H:%M')}")
-        print("=" * 50)
+            # seed ปกติส่งเป็น statement เดียว (เช็คห้องเดิมอยู่ใน CTE); ข้อมูลจำนวนมากค่อยแบ่ง batch
+            if len(rooms) + len(bookings) <= _BATCH_SIZE:
+                room_count, booking_count = conn.execute(_seed_statement(rooms, bookings)).one()
+            else:
+                room_count, booking_count = _insert_in_batches(conn, rooms, bookings)
+
+        if room_count == 0:
+            print("Found existing rooms, skipping sample data")
+            return True
+        print(f"Created {room_count} rooms")
+        print(f"Created {booking_count} sample bookings")
+
+        # รวม summary แล้วเขียนออกครั้งเดียว แทน print ทีละบรรทัด
+        buf = io.StringIO()
+        buf.write("\nSample Data Summary:\n" + "=" * 50 + "\nRooms:\n")
+        buf.write(_summary_lines(
+            rooms,
+            lambda i, room: f"  {i}. {room['name']} (ความจุ: {room['capacity']} คน) - {room['location']}"
+        ))
+        buf.write("\n\nBookings:\n")
+        buf.write(_summary_lines(
+            bookings,
+            lambda i, booking: f"  {i}. {booking['title']} - {booking['start_datetime'].strftime('%d/%m/%Y %H:%M')}"
+        ))
+        buf.write("\n" + "=" * 50 + "\n")
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
         return True
 
     except Exception as e:
         print(f"Error creating sample data: {e}")
-        db.rollback()
         return False
-    finally:
-        db.close()
 
 
 if __name__ == "__main__":
@@ -236,7 +453,13 @@ if __name__ == "__main__":
                 print("ยกเลิกการทำงาน")
                 sys.exit(0)
         elif command == "sample":
-            success = create_tables() and create_sample_data()
+            # python create_tables.py sample [n_rooms] [n_bookings]
+            # รับแค่จำนวนเต็มไม่ติดลบ (ค่าติดลบจะไป slice รายการห้องตัวอย่าง)
+            if not all(arg.isdecimal() for arg in sys.argv[2:4]):
+                print("วิธีใช้: python create_tables.py sample [n_rooms] [n_bookings]")
+                sys.exit(1)
+            counts = [int(arg) for arg in sys.argv[2:4]]
+            success = create_tables() and create_sample_data(*counts)
         else:
             print("คำสั่งไม่ถูกต้อง")
             sys.exit(1)
@@ -251,5 +474,5 @@ if __name__ == "__main__":
         print("  create      - สร้างตาราง")
         print("  drop        - ลบตารางทั้งหมด")
         print("  reset       - ลบและสร้างตารางใหม่")
-        print("  sample      - สร้างตารางพร้อมข้อมูลตัวอย่าง")
+        print("  sample      - สร้างตารางพร้อมข้อมูลตัวอย่าง (sample [n_rooms] [n_bookings])")
         print("  docker-init - สำหรับ Docker (รอ DB + สร้างตาราง + ข้อมูลตัวอย่าง)")
\ No newline at end of file